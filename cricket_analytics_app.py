@@ -1,35 +1,430 @@
+import hashlib
+import pathlib
+import tempfile
+
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Numba is optional; without it per-player reductions use pandas groupby
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+# Numeric columns used by the dashboard, split by the dtype they're stored as
+INT_COLS = ['Matches_Played', 'Centuries', 'Half_Centuries', 'Wickets_Taken']
+FLOAT_COLS = ['Runs_Scored', 'Batting_Average', 'Batting_Strike_Rate',
+              'Bowling_Average', 'Economy_Rate']
+NUMERIC_COLS = INT_COLS + FLOAT_COLS
+
+# Columns read from the uploaded CSV; anything else is skipped by the parser
+WANTED_COLS = {'Player_Name', 'Year', *NUMERIC_COLS}
+
+# Directory holding parsed uploads as Parquet, shared across sessions
+DATA_CACHE_DIR = pathlib.Path('.cache')
+
+# Bump when load_data's parsing or downcasting changes; together with the
+# column lists it is part of every cache key, so stale entries are skipped
+DATA_CACHE_VERSION = 1
+DATA_CACHE_SCHEMA = repr(
+    (DATA_CACHE_VERSION, sorted(WANTED_COLS), INT_COLS, FLOAT_COLS)
+).encode('utf-8')
+
+# Row cap for parallel coordinates, which draws one line per row
+MAX_PARALLEL_ROWS = 5000
+
+# Check that a numeric column holds only whole numbers (NaN is ignored), so
+# it can be stored as an integer type without losing data
+def is_whole(values):
+    return bool((values.dropna() % 1 == 0).all())
+
 # Load data function with caching
 @st.cache_data
 def load_data(file):
     try:
-        df = pd.read_csv(file)
+        # Uploads parsed before (in any session) are memory-mapped from disk;
+        # an unreadable entry is removed and the file parsed again
+        file_hash = hashlib.blake2b(file.getbuffer())
+        file_hash.update(DATA_CACHE_SCHEMA)
+        cache_path = DATA_CACHE_DIR / f"{file_hash.hexdigest()}.parquet"
+        if cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path, memory_map=True)
+            except Exception:
+                cache_path.unlink(missing_ok=True)
         
-        # Convert relevant columns to numeric
-        numeric_cols = ['Matches_Played', 'Runs_Scored', 'Batting_Average', 
-                       'Batting_Strike_Rate', 'Centuries', 'Half_Centuries',
-                       'Wickets_Taken', 'Bowling_Average', 'Economy_Rate']
+        # Only parse the columns the dashboard uses
+        header = pd.read_csv(file, nrows=0).columns
+        file.seek(0)
+        usecols = [col for col in header if col in WANTED_COLS]
         
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Numeric columns are typed by the parser itself; 'No stats' marks
+        # seasons without data and is read as NaN
+        typed_cols = [col for col in NUMERIC_COLS + ['Year'] if col in usecols]
+        
+        # Arrow's multithreaded reader parses outside the Python layer
+        convert_options = pacsv.ConvertOptions(
+            include_columns=usecols,
+            column_types={col: pa.float64() for col in typed_cols},
+            null_values=pacsv.ConvertOptions().null_values + ['No stats']
+        )
+        try:
+            df = pacsv.read_csv(file, convert_options=convert_options).to_pandas()
+        except pa.ArrowInvalid:
+            # Some other non-numeric cell; read those columns as text and
+            # coerce, so stray values become NaN instead of rejecting the file
+            file.seek(0)
+            convert_options.column_types = {col: pa.string() for col in typed_cols}
+            df = pacsv.read_csv(file, convert_options=convert_options).to_pandas()
+            df[typed_cols] = df[typed_cols].apply(pd.to_numeric, errors='coerce')
         
-        # Convert 'Year' column to numeric
+        # Drop rows with NaN in 'Year' and sort by year so the year filter
+        # can be taken as a slice
         if 'Year' in df.columns:
-            df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-            # Optionally drop rows with NaN in 'Year'
-            df = df.dropna(subset=['Year'])
+            df = df.dropna(subset=['Year']).sort_values('Year', kind='stable', ignore_index=True)
+            if is_whole(df['Year']):
+                df['Year'] = df['Year'].astype('int16')
+        
+        # Downcast metrics to 32-bit; counts stay nullable for missing stats,
+        # and fall back to float32 if a file has fractional counts
+        for col in INT_COLS:
+            if col in df.columns:
+                df[col] = df[col].astype('Int32' if is_whole(df[col]) else 'float32')
+        float_cols = [col for col in FLOAT_COLS if col in df.columns]
+        df[float_cols] = df[float_cols].astype('float32')
+        
+        # Store player names as a categorical so filtering compares int codes;
+        # the inferred categories are sorted and double as the player list
+        if 'Player_Name' in df.columns:
+            df['Player_Name'] = df['Player_Name'].astype('category')
+        
+        # Each writer gets its own temporary file and renames it into place,
+        # so concurrent sessions never read a partial cache entry; a failed
+        # write only costs the speedup
+        tmp_path = None
+        try:
+            DATA_CACHE_DIR.mkdir(exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=DATA_CACHE_DIR, suffix='.tmp', delete=False) as tmp:
+                tmp_path = pathlib.Path(tmp.name)
+            df.to_parquet(tmp_path)
+            tmp_path.replace(cache_path)
+        except Exception:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
         
         return df
     except Exception as e:
         st.error(f"Error loading CSV file: {e}")
         return None
 
+# Filter function with caching, so reruns with unchanged filters skip the mask
+@st.cache_data(show_spinner=False)
+def filter_df(df, year_lo, year_hi, players):
+    names = df['Player_Name'].cat
+    codes = names.categories.get_indexer(list(players))
+    player_mask = np.isin(names.codes.to_numpy(), codes[codes >= 0])
+    
+    if 'Year' in df.columns:
+        # Year is sorted on load, so the selected range is a contiguous slice
+        years = df['Year'].to_numpy()
+        lo = np.searchsorted(years, year_lo, side='left')
+        hi = np.searchsorted(years, year_hi, side='right')
+        return df.iloc[lo:hi][player_mask[lo:hi]]
+    return df[player_mask]
+
+if nb is not None:
+    # Single pass over the rows, producing sum, non-NaN count, min and max
+    # of every metric for every player code at once
+    @nb.njit(cache=True)
+    def _reduce_by_code(codes, values, ngroups):
+        n, m = values.shape
+        out = np.empty((4, ngroups, m))
+        out[0] = 0.0
+        out[1] = 0.0
+        out[2] = np.inf
+        out[3] = -np.inf
+        for i in range(n):
+            g = codes[i]
+            if g < 0:
+                continue
+            for j in range(m):
+                v = values[i, j]
+                if np.isnan(v):
+                    continue
+                out[0, g, j] += v
+                out[1, g, j] += 1.0
+                if v < out[2, g, j]:
+                    out[2, g, j] = v
+                if v > out[3, g, j]:
+                    out[3, g, j] = v
+        return out
+
+# Per-player mean, sum, max and min with caching, computed together so
+# switching the comparison method doesn't re-aggregate. The radar, heatmap and
+# comparison views all pass every available metric and slice out the ones
+# they show, so they share one cached reduction per filter
+@st.cache_data(show_spinner=False)
+def player_reductions(df, metrics):
+    metrics = list(metrics)
+    
+    if nb is None:
+        grouped = df.groupby('Player_Name', observed=True)[metrics]
+        return {how: getattr(grouped, how)() for how in ['mean', 'sum', 'max', 'min']}
+    
+    names = df['Player_Name'].cat
+    codes = names.codes.to_numpy().astype(np.int32)
+    values = np.ascontiguousarray(df[metrics].to_numpy(dtype=np.float64, na_value=np.nan))
+    sums, counts, mins, maxs = _reduce_by_code(codes, values, len(names.categories))
+    
+    # Keep only players with rows, as groupby(observed=True) does
+    present = np.bincount(codes[codes >= 0], minlength=len(names.categories)) > 0
+    sums, counts, mins, maxs = sums[present], counts[present], mins[present], maxs[present]
+    empty = counts == 0
+    
+    index = pd.CategoricalIndex(
+        names.categories[present], categories=names.categories, name='Player_Name'
+    )
+    
+    def to_frame(values):
+        return pd.DataFrame(values, index=index, columns=metrics)
+    
+    return {
+        'mean': to_frame(np.divide(sums, counts, out=np.full_like(sums, np.nan), where=~empty)),
+        'sum': to_frame(sums),
+        'max': to_frame(np.where(empty, np.nan, maxs)),
+        'min': to_frame(np.where(empty, np.nan, mins))
+    }
+
+# Player/season averages for charting with caching; rows come out sorted by
+# player then year, so each player's line is one contiguous, ordered run
+@st.cache_data(show_spinner=False)
+def player_season_df(df, metrics):
+    if 'Year' not in df.columns:
+        return df.sort_values('Player_Name', kind='stable')
+    return df.groupby(['Player_Name', 'Year'], as_index=False, observed=True)[
+        [col for col in metrics if col != 'Year']
+    ].mean()
+
+# Set the figure's uirevision so the browser keeps zoom and legend state
+# across reruns until the inputs that define the view (e.g. the metric) change
+def finish_figure(fig, *view):
+    fig.update_layout(uirevision=repr(view))
+    return fig
+
+# Figure builders, cached with st.cache_resource so reruns with unchanged
+# inputs reuse the figure instead of rebuilding it
+@st.cache_resource(show_spinner=False)
+def build_bar_chart(df, metric):
+    if 'Year' in df.columns:
+        # px only creates traces for players in the first animation frame, so
+        # give every player a (possibly empty) row in every season
+        seasons = pd.MultiIndex.from_product(
+            [df['Player_Name'].unique(), sorted(df['Year'].unique())],
+            names=['Player_Name', 'Year']
+        )
+        df = df.set_index(['Player_Name', 'Year']).reindex(seasons).reset_index()
+    
+    fig = px.bar(
+        df,
+        x="Player_Name",
+        y=metric,
+        color="Player_Name",
+        animation_frame="Year" if 'Year' in df.columns else None,
+        category_orders={'Year': sorted(df['Year'].unique())} if 'Year' in df.columns else None,
+        title=f"{metric} Comparison"
+    )
+    return finish_figure(fig, 'bar', metric)
+
+@st.cache_resource(show_spinner=False)
+def build_line_chart(df, metric):
+    fig = px.line(
+        df,
+        x="Year" if 'Year' in df.columns else "Player_Name",
+        y=metric,
+        color="Player_Name",
+        markers=True,
+        title=f"{metric} Trend Over Time"
+    )
+    return finish_figure(fig, 'line', metric)
+
+@st.cache_resource(show_spinner=False)
+def build_scatter_plot(df, x_metric, y_metric):
+    fig = px.scatter(
+        df,
+        x=x_metric,
+        y=y_metric,
+        color="Player_Name",
+        size="Matches_Played" if 'Matches_Played' in df.columns else None,
+        hover_name="Year" if 'Year' in df.columns else "Player_Name",
+        title=f"{x_metric} vs {y_metric}"
+    )
+    return finish_figure(fig, 'scatter', x_metric, y_metric)
+
+@st.cache_resource(show_spinner=False)
+def build_radar_chart(df, metrics, players):
+    # df is indexed by player, so each trace is a row lookup rather than a scan
+    radar_values = df.reindex(list(players))[list(metrics)].dropna(how='all')
+    
+    fig = go.Figure()
+    
+    for player, values in zip(radar_values.index, radar_values.to_numpy()):
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=metrics,
+            fill='toself',
+            name=player
+        ))
+    
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True)),
+        showlegend=True,
+        title="Player Comparison Radar Chart"
+    )
+    return finish_figure(fig, 'radar', metrics)
+
+@st.cache_resource(show_spinner=False)
+def build_distribution_plot(df, metric, kind):
+    if kind == "Box Plot":
+        fig = px.box(
+            df,
+            x="Player_Name",
+            y=metric,
+            color="Player_Name",
+            title=f"Distribution of {metric}"
+        )
+        return finish_figure(fig, kind, metric)
+    fig = px.violin(
+        df,
+        x="Player_Name",
+        y=metric,
+        color="Player_Name",
+        box=True,
+        title=f"Distribution of {metric}"
+    )
+    return finish_figure(fig, kind, metric)
+
+@st.cache_resource(show_spinner=False)
+def build_combo_chart(df, primary_metric, secondary_metric):
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    # Add primary metric (bar)
+    fig.add_trace(
+        go.Bar(
+            x=df['Player_Name'],
+            y=df[primary_metric],
+            name=primary_metric
+        ),
+        secondary_y=False
+    )
+    
+    # Add secondary metric (line)
+    fig.add_trace(
+        go.Scatter(
+            x=df['Player_Name'],
+            y=df[secondary_metric],
+            name=secondary_metric,
+            mode='lines+markers'
+        ),
+        secondary_y=True
+    )
+    
+    fig.update_layout(
+        title_text=f"{primary_metric} vs {secondary_metric}",
+        hovermode="x unified"
+    )
+    return finish_figure(fig, 'combo', primary_metric, secondary_metric)
+
+@st.cache_resource(show_spinner=False)
+def build_heatmap(df):
+    fig = px.imshow(
+        df,
+        labels=dict(x="Metric", y="Player", color="Value"),
+        x=df.columns.tolist(),
+        y=df.index,
+        aspect="auto",
+        title="Player Performance Heatmap"
+    )
+    fig.update_xaxes(side="top")
+    return finish_figure(fig, 'heatmap', tuple(df.columns))
+
+@st.cache_resource(show_spinner=False)
+def build_comparison_bar_chart(df, metrics):
+    # One trace per metric straight from the wide frame, no melt needed
+    fig = go.Figure([
+        go.Bar(name=m, x=df['Player_Name'], y=df[m])
+        for m in metrics
+    ])
+    fig.update_layout(barmode='group', title="Metric Comparison")
+    return finish_figure(fig, 'comparison bar', metrics)
+
+@st.cache_resource(show_spinner=False)
+def build_comparison_line_chart(df):
+    fig = px.line(
+        df.melt(id_vars='Player_Name'),
+        x='variable',
+        y='value',
+        color='Player_Name',
+        markers=True,
+        title="Metric Trends by Player"
+    )
+    return finish_figure(fig, 'comparison line', tuple(df.columns))
+
+# Color settings mapping each player to a point on a shared colorscale
+def player_colors(names):
+    names = names.cat.remove_unused_categories()
+    return dict(
+        color=names.cat.codes,
+        colorscale='Turbo',
+        showscale=True,
+        colorbar=dict(
+            tickvals=list(range(len(names.cat.categories))),
+            ticktext=names.cat.categories.tolist()
+        )
+    )
+
+# Scatter matrix built directly with graph_objects
+@st.cache_resource(show_spinner=False)
+def build_scatter_matrix(df, metrics):
+    fig = go.Figure(go.Splom(
+        dimensions=[dict(label=m, values=df[m]) for m in metrics],
+        text=df['Player_Name'],
+        marker=player_colors(df['Player_Name'])
+    ))
+    fig.update_layout(title="Scatter Matrix of Player Metrics")
+    return finish_figure(fig, 'scatter matrix', metrics)
+
+# Parallel coordinates built directly with graph_objects
+@st.cache_resource(show_spinner=False)
+def build_parallel_coordinates(df, metrics):
+    fig = go.Figure(go.Parcoords(
+        dimensions=[dict(label=m, values=df[m]) for m in metrics],
+        line=player_colors(df['Player_Name'])
+    ))
+    fig.update_layout(title="Parallel Coordinates Analysis")
+    return finish_figure(fig, 'parallel coordinates', metrics)
+
+# CSV export with caching, so the download payload is only built once per filter
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+# Dataset statistics with caching
+@st.cache_data(show_spinner=False)
+def summary_statistics(df):
+    return df.describe()
+
+@st.cache_data(show_spinner=False)
+def missing_values(df):
+    missing_data = df.isnull().sum().reset_index()
+    missing_data.columns = ['Column', 'Missing Values']
+    return missing_data
+
 # App title and description
 st.title("🏏 Advanced Cricket Analytics Dashboard")
 st.markdown("""
@@ -47,6 +442,9 @@ if uploaded_file is not None:
     if df is not None:
         st.success("✅ Data loaded successfully!")
         
+        # Numeric metrics available for visualization (dtypes are fixed on load)
+        available_metrics = df.select_dtypes(include='number').columns.tolist()
+        
         # Sidebar filters
         st.sidebar.header("🔍 Filter Options")
         
@@ -63,7 +461,8 @@ if uploaded_file is not None:
             selected_years = (None, None)
         
         # Player selection with search
-        all_players = sorted(df['Player_Name'].unique()) if 'Player_Name' in df.columns else []
+        # Categories are built sorted on load, so no unique/sort pass is needed
+        all_players = df['Player_Name'].cat.categories.tolist() if 'Player_Name' in df.columns else []
         selected_players = st.sidebar.multiselect(
             "Select Players (max 6)",
             options=all_players,
@@ -72,13 +471,7 @@ if uploaded_file is not None:
         )
         
         # Apply filters
-        if 'Year' in df.columns:
-            filtered_df = df[
-                (df['Year'].between(*selected_years)) & 
-                (df['Player_Name'].isin(selected_players))
-            ]
-        else:
-            filtered_df = df[df['Player_Name'].isin(selected_players)]
+        filtered_df = filter_df(df, *selected_years, tuple(sorted(selected_players)))
         
         # Page selection with icons
         page = st.radio("Navigate to:", 
@@ -96,19 +489,17 @@ if uploaded_file is not None:
                 # Download button
                 st.download_button(
                     label="💾 Download Current Data",
-                    data=filtered_df.to_csv(index=False).encode('utf-8'),
+                    data=to_csv_bytes(filtered_df),
                     file_name='filtered_cricket_stats.csv',
                     mime='text/csv'
                 )
             
             with st.expander("📈 Dataset Statistics"):
                 st.write("Summary Statistics:")
-                st.dataframe(filtered_df.describe())
+                st.dataframe(summary_statistics(filtered_df))
                 
                 st.write("Missing Values:")
-                missing_data = filtered_df.isnull().sum().reset_index()
-                missing_data.columns = ['Column', 'Missing Values']
-                st.dataframe(missing_data)
+                st.dataframe(missing_values(filtered_df))
         
         # Performance Analysis Tab
         elif page == "📈 Performance Analysis":
@@ -117,10 +508,6 @@ if uploaded_file is not None:
             if not selected_players:
                 st.warning("Please select at least one player")
             else:
-                # Available metrics for visualization
-                available_metrics = [col for col in filtered_df.columns 
-                                   if filtered_df[col].dtype in ['int64', 'float64']]
-                
                 col1, col2 = st.columns(2)
                 
                 with col1:
@@ -147,40 +534,21 @@ if uploaded_file is not None:
                     ]
                 )
                 
+                # One row per player and season keeps figure construction cheap
+                plot_df = player_season_df(filtered_df, tuple(available_metrics))
+                
                 # Generate visualizations based on selection
                 if viz_type == "Bar Chart":
-                    fig = px.bar(
-                        filtered_df,
-                        x="Player_Name",
-                        y=primary_metric,
-                        color="Player_Name",
-                        animation_frame="Year" if 'Year' in filtered_df.columns else None,
-                        title=f"{primary_metric} Comparison"
-                    )
+                    fig = build_bar_chart(plot_df, primary_metric)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 elif viz_type == "Line Chart":
-                    fig = px.line(
-                        filtered_df,
-                        x="Year" if 'Year' in filtered_df.columns else "Player_Name",
-                        y=primary_metric,
-                        color="Player_Name",
-                        markers=True,
-                        title=f"{primary_metric} Trend Over Time"
-                    )
+                    fig = build_line_chart(plot_df, primary_metric)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 elif viz_type == "Scatter Plot":
                     if secondary_metric != 'None':
-                        fig = px.scatter(
-                            filtered_df,
-                            x=primary_metric,
-                            y=secondary_metric,
-                            color="Player_Name",
-                            size="Matches_Played" if 'Matches_Played' in filtered_df.columns else None,
-                            hover_name="Year" if 'Year' in filtered_df.columns else "Player_Name",
-                            title=f"{primary_metric} vs {secondary_metric}"
-                        )
+                        fig = build_scatter_plot(plot_df, primary_metric, secondary_metric)
                         st.plotly_chart(fig, use_container_width=True)
                     else:
                         st.warning("Please select a secondary metric for scatter plot")
@@ -194,77 +562,17 @@ if uploaded_file is not None:
                         )
                         
                         if metrics_for_radar:
-                            radar_df = filtered_df.groupby('Player_Name')[metrics_for_radar].mean().reset_index()
-                            
-                            fig = go.Figure()
-                            
-                            for player in selected_players:
-                                player_data = radar_df[radar_df['Player_Name'] == player]
-                                fig.add_trace(go.Scatterpolar(
-                                    r=player_data[metrics_for_radar].values[0],
-                                    theta=metrics_for_radar,
-                                    fill='toself',
-                                    name=player
-                                ))
-                            
-                            fig.update_layout(
-                                polar=dict(radialaxis=dict(visible=True)),
-                                showlegend=True,
-                                title="Player Comparison Radar Chart"
-                            )
-                            
+                            radar_df = player_reductions(filtered_df, tuple(available_metrics))['mean'][metrics_for_radar]
+                            fig = build_radar_chart(radar_df, tuple(metrics_for_radar), tuple(selected_players))
                             st.plotly_chart(fig, use_container_width=True)
                 
                 elif viz_type in ["Box Plot", "Violin Plot"]:
-                    if viz_type == "Box Plot":
-                        fig = px.box(
-                            filtered_df,
-                            x="Player_Name",
-                            y=primary_metric,
-                            color="Player_Name",
-                            title=f"Distribution of {primary_metric}"
-                        )
-                    else:
-                        fig = px.violin(
-                            filtered_df,
-                            x="Player_Name",
-                            y=primary_metric,
-                            color="Player_Name",
-                            box=True,
-                            title=f"Distribution of {primary_metric}"
-                        )
+                    fig = build_distribution_plot(filtered_df, primary_metric, viz_type)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 elif viz_type == "Combo Chart":
                     if secondary_metric != 'None':
-                        fig = make_subplots(specs=[[{"secondary_y": True}]])
-                        
-                        # Add primary metric (bar)
-                        fig.add_trace(
-                            go.Bar(
-                                x=filtered_df['Player_Name'],
-                                y=filtered_df[primary_metric],
-                                name=primary_metric
-                            ),
-                            secondary_y=False
-                        )
-                        
-                        # Add secondary metric (line)
-                        fig.add_trace(
-                            go.Scatter(
-                                x=filtered_df['Player_Name'],
-                                y=filtered_df[secondary_metric],
-                                name=secondary_metric,
-                                mode='lines+markers'
-                            ),
-                            secondary_y=True
-                        )
-                        
-                        fig.update_layout(
-                            title_text=f"{primary_metric} vs {secondary_metric}",
-                            hovermode="x unified"
-                        )
-                        
+                        fig = build_combo_chart(filtered_df, primary_metric, secondary_metric)
                         st.plotly_chart(fig, use_container_width=True)
                     else:
                         st.warning("Please select a secondary metric for combo chart")
@@ -278,17 +586,8 @@ if uploaded_file is not None:
                         )
                         
                         if metrics_for_heatmap:
-                            heatmap_df = filtered_df.groupby('Player_Name')[metrics_for_heatmap].mean()
-                            
-                            fig = px.imshow(
-                                heatmap_df,
-                                labels=dict(x="Metric", y="Player", color="Value"),
-                                x=metrics_for_heatmap,
-                                y=heatmap_df.index,
-                                aspect="auto",
-                                title="Player Performance Heatmap"
-                            )
-                            fig.update_xaxes(side="top")
+                            heatmap_df = player_reductions(filtered_df, tuple(available_metrics))['mean'][metrics_for_heatmap]
+                            fig = build_heatmap(heatmap_df)
                             st.plotly_chart(fig, use_container_width=True)
                 
                 elif viz_type == "Parallel Coordinates":
@@ -300,11 +599,9 @@ if uploaded_file is not None:
                         )
                         
                         if metrics_for_parallel:
-                            fig = px.parallel_coordinates(
-                                filtered_df,
-                                color="Player_Name",
-                                dimensions=metrics_for_parallel,
-                                title="Parallel Coordinates Analysis"
+                            fig = build_parallel_coordinates(
+                                plot_df.sample(n=min(len(plot_df), MAX_PARALLEL_ROWS), random_state=0),
+                                tuple(metrics_for_parallel)
                             )
                             st.plotly_chart(fig, use_container_width=True)
         
@@ -315,10 +612,6 @@ if uploaded_file is not None:
             if len(selected_players) < 2:
                 st.warning("Please select at least 2 players for comparison")
             else:
-                # Available metrics for comparison
-                available_metrics = [col for col in filtered_df.columns 
-                                   if filtered_df[col].dtype in ['int64', 'float64']]
-                
                 if not available_metrics:
                     st.error("No numeric metrics found for comparison")
                 else:
@@ -338,14 +631,9 @@ if uploaded_file is not None:
                     if comparison_metrics:
                         try:
                             # Calculate comparison based on selected method
-                            if comparison_method == "Mean":
-                                comparison_df = filtered_df.groupby('Player_Name')[comparison_metrics].mean().reset_index()
-                            elif comparison_method == "Sum":
-                                comparison_df = filtered_df.groupby('Player_Name')[comparison_metrics].sum().reset_index()
-                            elif comparison_method == "Max":
-                                comparison_df = filtered_df.groupby('Player_Name')[comparison_metrics].max().reset_index()
-                            else:
-                                comparison_df = filtered_df.groupby('Player_Name')[comparison_metrics].min().reset_index()
+                            comparison_df = player_reductions(
+                                filtered_df, tuple(available_metrics)
+                            )[comparison_method.lower()][comparison_metrics].reset_index()
                             
                             # Display comparison results
                             st.subheader("📊 Comparison Results")
@@ -353,10 +641,14 @@ if uploaded_file is not None:
                             tab1, tab2, tab3 = st.tabs(["Table View", "Visual Comparison", "Radar View"])
                             
                             with tab1:
+                                # Formatting is left to the frontend instead of
+                                # rendering a Styler on every rerun
                                 st.dataframe(
-                                    comparison_df.style
-                                    .background_gradient(cmap='Blues')
-                                    .format("{:.2f}", subset=comparison_metrics),
+                                    comparison_df,
+                                    column_config={
+                                        m: st.column_config.NumberColumn(format="%.2f")
+                                        for m in comparison_metrics
+                                    },
                                     height=400,
                                     use_container_width=True
                                 )
@@ -369,54 +661,23 @@ if uploaded_file is not None:
                                 )
                                 
                                 if viz_type == "Bar Chart":
-                                    fig = px.bar(
-                                        comparison_df.melt(id_vars='Player_Name'),
-                                        x='Player_Name',
-                                        y='value',
-                                        color='variable',
-                                        barmode='group',
-                                        title="Metric Comparison"
-                                    )
+                                    fig = build_comparison_bar_chart(comparison_df, tuple(comparison_metrics))
                                     st.plotly_chart(fig, use_container_width=True)
                                 
                                 elif viz_type == "Line Chart":
-                                    fig = px.line(
-                                        comparison_df.melt(id_vars='Player_Name'),
-                                        x='variable',
-                                        y='value',
-                                        color='Player_Name',
-                                        markers=True,
-                                        title="Metric Trends by Player"
-                                    )
+                                    fig = build_comparison_line_chart(comparison_df)
                                     st.plotly_chart(fig, use_container_width=True)
                                 
                                 elif viz_type == "Scatter Matrix":
-                                    fig = px.scatter_matrix(
-                                        comparison_df,
-                                        dimensions=comparison_metrics,
-                                        color="Player_Name",
-                                        title="Scatter Matrix of Player Metrics"
-                                    )
+                                    fig = build_scatter_matrix(comparison_df, tuple(comparison_metrics))
                                     st.plotly_chart(fig, use_container_width=True)
                             
                             with tab3:
-                                fig = go.Figure()
-                                
-                                for player in selected_players:
-                                    player_data = comparison_df[comparison_df['Player_Name'] == player]
-                                    fig.add_trace(go.Scatterpolar(
-                                        r=player_data[comparison_metrics].values[0],
-                                        theta=comparison_metrics,
-                                        fill='toself',
-                                        name=player
-                                    ))
-                                
-                                fig.update_layout(
-                                    polar=dict(radialaxis=dict(visible=True)),
-                                    showlegend=True,
-                                    title="Player Comparison Radar Chart"
+                                fig = build_radar_chart(
+                                    comparison_df.set_index('Player_Name'),
+                                    tuple(comparison_metrics),
+                                    tuple(selected_players)
                                 )
-                                
                                 st.plotly_chart(fig, use_container_width=True)
                         
                         except Exception as e: